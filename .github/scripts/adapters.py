@@ -1,37 +1,52 @@
 import re
-import urllib
+from collections.abc import Iterator
+from urllib.parse import quote
+
+ALLEGRO_SEARCH_URL = "https://allegro.pl/listing?string="
+
+LINE_PATTERN = re.compile(r"[^\r\n]+")
+# Markdown list bullets: "-", "*", "+", "1." or "1)", optionally with a checkbox
+BULLET_PATTERN = re.compile(r"^(?:[-*+]|\d+[.)])(?:\s+|$)(?:\[[ xX]\](?:\s+|$))?")
+LINK_PATTERN = re.compile(r"^(?:https?://|www\.)[^\s/?#]+\.[^\s]+$", re.IGNORECASE)
+DESCRIPTION_PREFIX_PATTERN = re.compile(r"^opis\s*:\s*", re.IGNORECASE)
 
 
 class ProductsAdapter:
     """
-    Converts a string with a list of products into the list of dicts
-    with product names and their links.
+    Converts a string with a list of products into dicts matching the
+    `produkty` entries of an organization file (`nazwa`, `link` and an
+    optional `opis`).
 
     When the link is missing, it adds a link to the search page for the
     product in the Allegro service.
 
-    The input data string should be a list of products separated by newlines.
-    Each line consists of a product name and an optional link to the product
-    at the end of the line.
+    The input data string should be a list of products separated by newlines,
+    optionally as a markdown list. Each line consists of a product name and an
+    optional link to the product at the end of the line. A line following
+    a product is its description when it starts with `opis:`, or when it is
+    nested (indented deeper) under a product given as a list item.
+
+    Products are parsed lazily, line by line, so iterating over the adapter
+    takes linear time and constant extra memory for any length of the list.
     """
 
     def __init__(self, data: str):
-        self.data: str = data
+        self.data: str = data or ""
 
-    def _get_product_search_link(self, product_name: str) -> str:
-        encoded_product = urllib.parse.quote(product_name)
-        return f"https://allegro.pl/listing?string={encoded_product}"
+    @staticmethod
+    def _get_product_search_link(product_name: str) -> str:
+        return ALLEGRO_SEARCH_URL + quote(product_name)
 
-    def _line_to_product_dict(self, line: str) -> dict[str, str]:
+    def _line_to_product_dict(self, line: str) -> dict[str, str] | None:
         """
         Converts a product line to the dict with the product name
         and the link to the product.
 
         Example 1: Product with a link
-        Input: Some product 1 https://domain.com
+        Input: - Some product 1 https://domain.com
         Output:
         {
-            "name": "Some product 1",
+            "nazwa": "Some product 1",
             "link": "https://domain.com"
         }
 
@@ -39,26 +54,74 @@ class ProductsAdapter:
         Input: Some product 2
         Output:
         {
-            "name": "Some product 2",
+            "nazwa": "Some product 2",
             "link": "https://allegro.pl/..."
         }
         """
-        *name, link = line.split()
+        line = BULLET_PATTERN.sub("", line)
+        name, _, link = line.rpartition(" ")
 
-        # check if link is actually a link or just part of the product name
-        if not re.match(r"^https?://", link):
-            name.append(link)
-            link = self._get_product_search_link(" ".join(name))
+        # check if the last word is actually a link or just part of the product name
+        if LINK_PATTERN.match(link):
+            name = name.strip()
+            if link.lower().startswith("www."):
+                link = f"https://{link}"
+            if not name:
+                name = link
+        else:
+            name = line
+            link = self._get_product_search_link(name)
+
+        if not name:
+            return None
 
         return {
-            "name": " ".join(name),
+            "nazwa": name,
             "link": link,
         }
 
+    @staticmethod
+    def _indent(raw_line: str) -> int:
+        return len(raw_line) - len(raw_line.lstrip())
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        product = None
+        # indent of the last product line, if it was a list item
+        bullet_indent = None
+        for match in LINE_PATTERN.finditer(self.data):
+            raw_line = match.group()
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            is_bullet = bool(BULLET_PATTERN.match(line))
+            is_description = DESCRIPTION_PREFIX_PATTERN.match(line) or (
+                bullet_indent is not None
+                and not is_bullet
+                and self._indent(raw_line) > bullet_indent
+            )
+            if is_description:
+                # a description before any product has nothing to describe
+                if product:
+                    description = DESCRIPTION_PREFIX_PATTERN.sub(
+                        "", " ".join(line.split())
+                    )
+                    product["opis"] = (
+                        f"{product['opis']} {description}"
+                        if "opis" in product
+                        else description
+                    )
+                continue
+
+            if product:
+                yield product
+            # None for list items without a name, e.g. an empty checkbox
+            product = self._line_to_product_dict(" ".join(line.split()))
+            bullet_indent = self._indent(raw_line) if is_bullet and product else None
+
+        if product:
+            yield product
+
     @property
     def products(self) -> list[dict[str, str]]:
-        return [
-            self._line_to_product_dict(line.strip())
-            for line in self.data.splitlines()
-            if len(line.strip())
-        ]
+        return list(self)
@@ -12,12 +12,19 @@ from consts import (
     NEW_ORG_ISSUE_DEFAULT_TITLE,
     NEW_ORG_FORM_SCHEMA_FILENAME,
 )
-from exceptions import BranchModifiedError
+from exceptions import BranchModifiedError, BranchUpdateConflictError
 from git_managers import create_organization_yaml_pr
 from labels import Label
 from parsers import GithubIssueFormDataParser
 from pullers import KRSDataPuller
-from utils import has_label
+from tracing import Tracer
+from utils import (
+    FORM_DATA_STATUS_PENDING,
+    get_form_data_hash,
+    get_last_processed_form_data_hash,
+    has_label,
+    set_last_processed_form_data_hash,
+)
 from validators import OrgIssueValidator
 from renderers import render_organization_yaml
 
@@ -48,72 +55,134 @@ repo = g.get_repo(GITHUB_REPOSITORY)
     required=True,
     help="GitHub issue number",
 )
-def process_new_org_issue(github_form_json, github_issue_number):
-    issue: Issue = repo.get_issue(github_issue_number)
-    data = GithubIssueFormDataParser(
-        json.loads(github_form_json),
-        NEW_ORG_FORM_SCHEMA_FILENAME,
-        extra_labels_map=EXTRA_LABELS_MAP,
-    )
-
-    validation_warnings = []
-
-    org_name = data.get(OrgFormSchemaIds.name)
-
-    if has_label(issue, Label.AUTO_VERIFIED):
-        issue.remove_from_labels(Label.AUTO_VERIFIED)
-
-    validator = OrgIssueValidator(data, issue)
-    if not validator.validate():
-        logger.error("Validation failed - not continuing")
-        return
-
-    if not (
-        krs_org := KRSDataPuller.get_org_by_krs(
-            issue, krs=data.get(OrgFormSchemaIds.krs)
+@click.option(
+    "--trace-file",
+    envvar="TRACE_FILE",
+    default="trace.json",
+    show_default=True,
+    help="Path of the JSON trace of the pipeline stages",
+)
+def process_new_org_issue(github_form_json, github_issue_number, trace_file):
+    tracer = Tracer(f"Przetwarzanie zgłoszenia #{github_issue_number}")
+    try:
+        with tracer.instrument_http():
+            run_new_org_issue_pipeline(tracer, github_form_json, github_issue_number)
+    finally:
+        tracer.export(trace_file)
+
+
+def run_new_org_issue_pipeline(
+    tracer: Tracer, github_form_json: str, github_issue_number: int
+):
+    with tracer.span("form parsing"):
+        issue: Issue = repo.get_issue(github_issue_number)
+        data = GithubIssueFormDataParser(
+            json.loads(github_form_json),
+            NEW_ORG_FORM_SCHEMA_FILENAME,
+            extra_labels_map=EXTRA_LABELS_MAP,
         )
-    ):
-        logger.error(msg="KRS db validation failed")
-        validation_warnings.append("Nie można zweryfikować KRS")
-    else:
-        data.set(OrgFormSchemaIds.krs_name, krs_org.name)
 
-    products_adapter = ProductsAdapter(data.get(OrgFormSchemaIds.products))
-    data.set(OrgFormSchemaIds.products, products_adapter.products)
+    # Edits that don't change the parsed form data (or runs superseded by a run
+    # that already processed the same data) are skipped entirely, as long as the
+    # last run touching the issue succeeded. Deleting the bot's form data hash
+    # comment forces reprocessing.
+    with tracer.span("coalescing"):
+        bot_login = g.get_user().login
+        form_data_hash = get_form_data_hash(data.form_data)
+        if get_last_processed_form_data_hash(issue, bot_login) == form_data_hash:
+            logger.info(
+                "Form data already processed - skipping. "
+                "Delete the form data hash comment to force reprocessing."
+            )
+            return
+        # Labels and comments change from here on, so the data of any previous
+        # run no longer describes the state of the issue until this run succeeds
+        set_last_processed_form_data_hash(
+            issue, form_data_hash, bot_login, status=FORM_DATA_STATUS_PENDING
+        )
 
-    # Update issue title
-    if issue.title == NEW_ORG_ISSUE_DEFAULT_TITLE:
-        logger.info("Updating issue title")
-        issue.edit(title=f"{NEW_ORG_ISSUE_DEFAULT_TITLE} {org_name}")
+    validation_warnings = []
 
-    logger.info("Adding auto-verified label")
-    if not validation_warnings:
-        issue.add_to_labels(Label.AUTO_VERIFIED)
+    org_name = data.get(OrgFormSchemaIds.name)
 
-        if not has_label(issue, Label.WAITING):
-            issue.add_to_labels(Label.WAITING)
-            issue.create_comment(
-                f"@{issue.user.login}, dziękujemy za podanie informacji. "
-                "Przyjęliśmy zgłoszenie dodania nowej organizacji. \n\n"
-                "Bardzo poważnie podchodzimy do weryfikacji "
-                "wszystkich zgłoszonych organizacji oraz ich danych. \n\n"
-                "W celu weryfikacji poprawności danych skontaktujemy się z Twoją organizacją "
-                "poprzez oficjalne dane kontaktowe dostępne na stronie internetowej organizacji "
-                "lub w rejestrze KRS. \n\n"
-                "W przypadku pozytywnej weryfikacji, otrzymasz od nas informację o dalszych krokach."
+    with tracer.span("validation"):
+        if has_label(issue, Label.AUTO_VERIFIED):
+            issue.remove_from_labels(Label.AUTO_VERIFIED)
+
+        validator = OrgIssueValidator(data, issue)
+        if not validator.validate():
+            logger.error("Validation failed - not continuing")
+            return
+        # e.g. possible duplicates, which need a manual review
+        validation_warnings.extend(validator.warnings)
+
+    with tracer.span("krs"):
+        if not (
+            krs_org := KRSDataPuller.get_org_by_krs(
+                issue, krs=data.get(OrgFormSchemaIds.krs)
             )
+        ):
+            logger.error(msg="KRS db validation failed")
+            validation_warnings.append("Nie można zweryfikować KRS")
+        else:
+            data.set(OrgFormSchemaIds.krs_name, krs_org.name)
+
+    with tracer.span("products"):
+        products_adapter = ProductsAdapter(data.get(OrgFormSchemaIds.products))
+        data.set(OrgFormSchemaIds.products, products_adapter.products)
+
+    with tracer.span("issue update"):
+        # Update issue title
+        if issue.title == NEW_ORG_ISSUE_DEFAULT_TITLE:
+            logger.info("Updating issue title")
+            issue.edit(title=f"{NEW_ORG_ISSUE_DEFAULT_TITLE} {org_name}")
+
+        logger.info("Adding auto-verified label")
+        if not validation_warnings:
+            issue.add_to_labels(Label.AUTO_VERIFIED)
+
+            if not has_label(issue, Label.WAITING):
+                issue.add_to_labels(Label.WAITING)
+                issue.create_comment(
+                    f"@{issue.user.login}, dziękujemy za podanie informacji. "
+                    "Przyjęliśmy zgłoszenie dodania nowej organizacji. \n\n"
+                    "Bardzo poważnie podchodzimy do weryfikacji "
+                    "wszystkich zgłoszonych organizacji oraz ich danych. \n\n"
+                    "W celu weryfikacji poprawności danych skontaktujemy się z Twoją organizacją "
+                    "poprzez oficjalne dane kontaktowe dostępne na stronie internetowej organizacji "
+                    "lub w rejestrze KRS. \n\n"
+                    "W przypadku pozytywnej weryfikacji, otrzymasz od nas informację o dalszych krokach."
+                )
 
     # create organization yaml file and add to the Pull Request
-    yaml_string = render_organization_yaml(data)
+    with tracer.span("yaml rendering"):
+        yaml_string = render_organization_yaml(data)
+
+    with tracer.span("git commit"):
+        try:
+            create_organization_yaml_pr(issue, yaml_string, data)
+        except BranchModifiedError:
+            logger.error("Branch was modified by someone else")
+            issue.create_comment(
+                "Aktualizacja pliku organizacji na podstawie opisu zgłoszenia niemożliwa. "
+                "Plik organizacji został już zmodyfikowany przez innego użytkownika."
+            )
+            return
+        except BranchUpdateConflictError:
+            logger.error("Branch kept changing during the update")
+            issue.create_comment(
+                "Aktualizacja pliku organizacji na podstawie opisu zgłoszenia niemożliwa. "
+                "Gałąź z plikiem organizacji była w tym czasie zmieniana przez inne "
+                "przetwarzanie zgłoszenia. Spróbuj ponownie edytując zgłoszenie."
+            )
+            return
 
-    try:
-        create_organization_yaml_pr(issue, yaml_string, data)
-    except BranchModifiedError:
-        logger.error("Branch was modified by someone else")
-        issue.create_comment(
-            "Aktualizacja pliku organizacji na podstawie opisu zgłoszenia niemożliwa. "
-            "Plik organizacji został już zmodyfikowany przez innego użytkownika."
-        )
+    # Only fully processed data is marked as processed; failed validation,
+    # unverified KRS or a branch update failure leave it pending, so the same
+    # data is processed again on the next edit or re-run
+    if not validation_warnings:
+        with tracer.span("coalescing"):
+            set_last_processed_form_data_hash(issue, form_data_hash, bot_login)
 
 
 if __name__ == "__main__":
@@ -24,3 +24,7 @@ EXTRA_LABELS_MAP = {"Nazwa w KRS": OrgFormSchemaIds.krs_name}
 
 
 ORG_SCHEMA_SLUG_FIELD = "adres"
+ORG_SCHEMA_KRS_FIELD = "krs"
+ORG_SCHEMA_NAME_FIELDS = ("nazwa", "nazwa_w_krs")
+
+ORGANIZATIONS_DIR = "../../organizations"
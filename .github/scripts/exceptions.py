@@ -2,5 +2,9 @@ class BranchModifiedError(ValueError):
     pass
 
 
+class BranchUpdateConflictError(ValueError):
+    pass
+
+
 class KRSMaintenanceError(Exception):
     pass
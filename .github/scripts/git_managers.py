@@ -2,7 +2,7 @@ import logging
 from dataclasses import dataclass
 
 from github import InputGitTreeElement
-from github.GithubException import UnknownObjectException
+from github.GithubException import GithubException, UnknownObjectException
 from github.GitCommit import GitCommit
 from github.GitRef import GitRef
 from github.Issue import Issue
@@ -10,11 +10,13 @@ from github.PullRequest import PullRequest
 from github.Repository import Repository
 
 from consts import OrgFormSchemaIds
-from exceptions import BranchModifiedError
+from exceptions import BranchModifiedError, BranchUpdateConflictError
 from parsers import GithubIssueFormDataParser
 
 logger = logging.getLogger(__file__)
 
+BRANCH_UPDATE_ATTEMPTS = 3
+
 
 @dataclass
 class GitManager:
@@ -44,10 +46,19 @@ class GitManager:
             logger.info(f"Found existing branch '{new_branch_name}'.")
         except UnknownObjectException:
             # Branch does not exist, create it from the source branch
-            branch_ref = self.repo.create_git_ref(
-                ref=f"refs/heads/{new_branch_name}", sha=source.commit.sha
-            )
-            logger.info(f"Branch '{new_branch_name}' created from '{source_branch}'.")
+            try:
+                branch_ref = self.repo.create_git_ref(
+                    ref=f"refs/heads/{new_branch_name}", sha=source.commit.sha
+                )
+                logger.info(
+                    f"Branch '{new_branch_name}' created from '{source_branch}'."
+                )
+            except GithubException as e:
+                if e.status != 422:
+                    raise
+                # Created in the meantime by a concurrent run
+                branch_ref = self.repo.get_git_ref(f"heads/{new_branch_name}")
+                logger.info(f"Branch '{new_branch_name}' created concurrently.")
 
         latest_commit = self.repo.get_commit(branch_ref.object.sha)
         if (
@@ -59,6 +70,30 @@ class GitManager:
 
         return branch_ref
 
+    def update_branch_ref(self, branch_ref: GitRef, expected_sha: str, new_sha: str):
+        """
+        Compare-and-swap update of the branch: moves the branch to `new_sha` only
+        if it still points to `expected_sha`.
+
+        The fresh ref is re-read just before the update, and the update itself
+        is not forced, so GitHub rejects it when the branch moved in between.
+        """
+        current_sha = self.repo.get_git_ref(
+            branch_ref.ref.removeprefix("refs/")
+        ).object.sha
+        if current_sha != expected_sha:
+            raise BranchUpdateConflictError(
+                f"Branch moved from {expected_sha} to {current_sha}"
+            )
+        try:
+            branch_ref.edit(new_sha, force=False)
+        except GithubException as e:
+            if e.status != 422:
+                raise
+            raise BranchUpdateConflictError(
+                f"Branch update to {new_sha} rejected: {e.data}"
+            ) from e
+
     def get_or_create_pr(
         self, target_branch: str, new_branch_name: str, pr_title: str, pr_body: str
     ) -> PullRequest:
@@ -86,13 +121,30 @@ class GitManager:
         file_contents: str,
         commit_message: str,
     ) -> GitRef:
-        """Create or update a remote branch with a file commit."""
-        branch = self.get_or_create_branch(source_branch, new_branch)
-        commit = self.commit_file_contents_to_branch(
-            branch, file_path, file_contents, commit_message
+        """
+        Create or update a remote branch with a file commit.
+
+        When a concurrent run moves the branch between reading it and updating it,
+        the commit is recreated on top of the new branch head.
+        """
+        for attempt in range(1, BRANCH_UPDATE_ATTEMPTS + 1):
+            branch = self.get_or_create_branch(source_branch, new_branch)
+            expected_sha = branch.object.sha
+            commit = self.commit_file_contents_to_branch(
+                branch, file_path, file_contents, commit_message
+            )
+            try:
+                self.update_branch_ref(branch, expected_sha, commit.sha)
+                return branch
+            except BranchUpdateConflictError as e:
+                logger.warning(
+                    f"Branch '{new_branch}' update conflict "
+                    f"(attempt {attempt}/{BRANCH_UPDATE_ATTEMPTS}): {e}"
+                )
+        raise BranchUpdateConflictError(
+            f"Could not update branch '{new_branch}' after "
+            f"{BRANCH_UPDATE_ATTEMPTS} attempts"
         )
-        branch.edit(commit.sha)
-        return branch
 
     def create_or_update_pr_with_file(
         self,
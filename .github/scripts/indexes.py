@@ -0,0 +1,144 @@
+import os
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+import yaml
+
+from consts import (
+    ORG_SCHEMA_KRS_FIELD,
+    ORG_SCHEMA_NAME_FIELDS,
+    ORG_SCHEMA_SLUG_FIELD,
+    ORGANIZATIONS_DIR,
+)
+
+NGRAM_SIZE = 3
+NAME_SIMILARITY_THRESHOLD = 0.6
+
+# Legal forms, filler words and animal-welfare vocabulary shared by most
+# organization names; they would make every foundation (or every regional
+# animal protection inspectorate) look similar to every other one
+NAME_STOPWORDS = {
+    "fundacja",
+    "fundacji",
+    "stowarzyszenie",
+    "stowarzyszenia",
+    "towarzystwo",
+    "inspektorat",
+    "ochrony",
+    "opieki",
+    "pomocy",
+    "centrum",
+    "schronisko",
+    "schroniska",
+    "zwierzeta",
+    "zwierzat",
+    "zwierzetom",
+    "zwierzetami",
+    "nad",
+    "dla",
+    "na",
+    "rzecz",
+    "i",
+    "w",
+    "z",
+    "im",
+}
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase name without diacritics, punctuation and common legal-form words."""
+    name = name.lower().replace("ł", "l")
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(char for char in name if not unicodedata.combining(char))
+    words = re.findall(r"[a-z0-9]+", name)
+    return " ".join(word for word in words if word not in NAME_STOPWORDS)
+
+
+def name_ngrams(name: str) -> set[str]:
+    normalized = f" {normalize_name(name)} "
+    return {
+        normalized[i : i + NGRAM_SIZE] for i in range(len(normalized) - NGRAM_SIZE + 1)
+    }
+
+
+@dataclass
+class NameMatch:
+    file_name: str
+    name: str
+    similarity: float
+
+
+@dataclass
+class OrganizationIndex:
+    """
+    Index of existing organizations over slugs, KRS numbers and character
+    n-grams of their names (`nazwa` and `nazwa_w_krs`).
+
+    Fuzzy name lookups only score organizations sharing at least one n-gram
+    with the queried name, instead of comparing against every organization.
+    """
+
+    slugs: dict[str, str] = field(default_factory=dict)
+    krs: dict[str, str] = field(default_factory=dict)
+    ngrams: dict[str, set[tuple[str, str]]] = field(
+        default_factory=lambda: defaultdict(set)
+    )
+    ngram_counts: dict[tuple[str, str], int] = field(default_factory=dict)
+
+    @classmethod
+    def from_directory(cls, organizations_dir: str = ORGANIZATIONS_DIR):
+        index = cls()
+        for root, _, files in os.walk(organizations_dir):
+            for file_name in files:
+                with open(os.path.join(root, file_name), "r") as f:
+                    index.add(file_name, yaml.safe_load(f))
+        return index
+
+    def add(self, file_name: str, org_data: dict):
+        slugs = org_data.get(ORG_SCHEMA_SLUG_FIELD)
+        for slug in slugs if isinstance(slugs, list) else [slugs]:
+            self.slugs[slug] = file_name
+
+        if krs := str(org_data.get(ORG_SCHEMA_KRS_FIELD) or "").strip():
+            self.krs[krs] = file_name
+
+        for name_field in ORG_SCHEMA_NAME_FIELDS:
+            if not (name := org_data.get(name_field)):
+                continue
+            key = (file_name, name)
+            ngrams = name_ngrams(name)
+            self.ngram_counts[key] = len(ngrams)
+            for ngram in ngrams:
+                self.ngrams[ngram].add(key)
+
+    def find_by_slug(self, slug: str) -> str | None:
+        return self.slugs.get(slug)
+
+    def find_by_krs(self, krs: str) -> str | None:
+        return self.krs.get(krs.strip())
+
+    def find_similar_names(
+        self, name: str, threshold: float = NAME_SIMILARITY_THRESHOLD
+    ) -> list[NameMatch]:
+        """
+        Returns organizations with a name whose n-gram Jaccard similarity to
+        `name` is at least `threshold`, best match per organization first.
+        """
+        query = name_ngrams(name)
+        shared = defaultdict(int)
+        for ngram in query:
+            for key in self.ngrams.get(ngram, ()):
+                shared[key] += 1
+
+        best: dict[str, NameMatch] = {}
+        for (file_name, org_name), common in shared.items():
+            union = len(query) + self.ngram_counts[(file_name, org_name)] - common
+            similarity = common / union
+            if similarity >= threshold and (
+                file_name not in best or similarity > best[file_name].similarity
+            ):
+                best[file_name] = NameMatch(file_name, org_name, similarity)
+
+        return sorted(best.values(), key=lambda match: -match.similarity)
@@ -8,6 +8,7 @@ class Label(enum.StrEnum):
     INVALID_POSTAL_CODE = "niepoprawny kod pocztowy"
     INVALID_PHONE = "niepoprawny numer telefonu"
     INVALID_SLUG = "niepoprawna nazwa strony"
+    POSSIBLE_DUPLICATE = "możliwy duplikat"
     AUTO_VERIFIED = "zweryfikowana automatycznie"
     WAITING = "oczekuje na akceptację"
 
@@ -0,0 +1,350 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from urllib.parse import quote, unquote, urlparse
+
+import click
+import requests
+import yaml
+from requests.adapters import HTTPAdapter
+
+from consts import ORGANIZATIONS_DIR
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__file__)
+
+USER_AGENT = "wyslij.co link checker (+https://wyslij.co)"
+
+CACHE_FILE = ".link-check-cache.json"
+# Stub runs never share results with real runs, which are keyed by the same URLs
+STUB_CACHE_FILE = ".link-check-stub-cache.json"
+
+# Statuses for which a HEAD request is not conclusive and GET should be retried
+HEAD_FALLBACK_STATUSES = {403, 405, 429, 501}
+
+
+@dataclass
+class ProductLink:
+    org_file: str
+    org_name: str
+    product_name: str
+    url: str
+
+
+@dataclass
+class LinkCheckResult:
+    url: str
+    ok: bool
+    status: int | None
+    method: str
+    checked_at: float
+    error: str = ""
+
+
+def extract_product_links(organizations_dir: str) -> list[ProductLink]:
+    links = []
+    for file_name in sorted(os.listdir(organizations_dir)):
+        if not file_name.endswith(".yaml"):
+            continue
+        with open(os.path.join(organizations_dir, file_name)) as f:
+            org_data = yaml.safe_load(f) or {}
+        for product in org_data.get("produkty") or []:
+            if product.get("link"):
+                links.append(
+                    ProductLink(
+                        org_file=file_name,
+                        org_name=org_data.get("nazwa", file_name),
+                        product_name=product.get("nazwa", ""),
+                        url=product["link"].strip(),
+                    )
+                )
+    return links
+
+
+class LinkCheckCache:
+    """
+    On-disk cache of successful link check results, valid for `ttl` seconds.
+
+    Failed checks are not cached: they are often transient (timeouts, connection
+    resets, 5xx) and a broken link should be re-checked on every run anyway.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self.results: dict[str, LinkCheckResult] = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.results = {
+                        url: LinkCheckResult(**result)
+                        for url, result in json.load(f).items()
+                    }
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                logger.warning(f"Ignoring unreadable link check cache {path}: {e}")
+
+    def get(self, url: str, now: float) -> LinkCheckResult | None:
+        result = self.results.get(url)
+        if result and result.ok and now - result.checked_at < self.ttl:
+            return result
+        return None
+
+    def set(self, result: LinkCheckResult):
+        if result.ok:
+            self.results[result.url] = result
+        else:
+            self.results.pop(result.url, None)
+
+    def save(self):
+        with open(self.path, "w") as f:
+            json.dump(
+                {url: asdict(result) for url, result in self.results.items()},
+                f,
+                indent=2,
+            )
+
+
+class HostRateLimiter:
+    """Keeps at least `interval` seconds between requests to the same host."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._last_request: dict[str, float] = {}
+        self._guard = threading.Lock()
+
+    def wait(self, host: str):
+        with self._guard:
+            lock = self._locks[host]
+        with lock:
+            elapsed = time.monotonic() - self._last_request.get(host, 0.0)
+            if elapsed < self.interval:
+                time.sleep(self.interval - elapsed)
+            self._last_request[host] = time.monotonic()
+
+
+@dataclass
+class LinkChecker:
+    """
+    Checks links concurrently over a pooled HTTP session.
+
+    Each link is checked with HEAD first; when the server does not support it
+    (or refuses it), the check falls back to a streamed GET.
+    """
+
+    workers: int = 8
+    timeout: float = 10.0
+    host_interval: float = 1.0
+    # Rewrites the URL actually requested, e.g. to point it at a stub server
+    rewrite_url: Callable[[str], str] | None = None
+
+    def __post_init__(self):
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.rate_limiter = HostRateLimiter(self.host_interval)
+
+    def _request(self, method: str, url: str) -> requests.Response:
+        self.rate_limiter.wait(urlparse(url).netloc)
+        target = self.rewrite_url(url) if self.rewrite_url else url
+        response = self.session.request(
+            method, target, timeout=self.timeout, allow_redirects=True, stream=True
+        )
+        response.close()
+        return response
+
+    def check(self, url: str) -> LinkCheckResult:
+        method = "HEAD"
+        try:
+            response = self._request(method, url)
+            if response.status_code in HEAD_FALLBACK_STATUSES:
+                method = "GET"
+                response = self._request(method, url)
+        except requests.RequestException as e:
+            return LinkCheckResult(
+                url=url,
+                ok=False,
+                status=None,
+                method=method,
+                checked_at=time.time(),
+                error=str(e),
+            )
+        return LinkCheckResult(
+            url=url,
+            ok=response.status_code < 400,
+            status=response.status_code,
+            method=method,
+            checked_at=time.time(),
+        )
+
+    def check_all(
+        self, urls: list[str], cache: LinkCheckCache
+    ) -> dict[str, LinkCheckResult]:
+        now = time.time()
+        results = {}
+        to_check = []
+        for url in dict.fromkeys(urls):
+            if cached := cache.get(url, now):
+                results[url] = cached
+            else:
+                to_check.append(url)
+
+        logger.info(
+            f"Checking {len(to_check)} links ({len(results)} cached results reused)"
+        )
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for result in executor.map(self.check, to_check):
+                cache.set(result)
+                results[result.url] = result
+        return results
+
+
+def render_report(links: list[ProductLink], results: dict[str, LinkCheckResult]) -> str:
+    by_org: dict[str, list[ProductLink]] = defaultdict(list)
+    for link in links:
+        by_org[link.org_file].append(link)
+
+    report = "# Raport linków do produktów\n"
+    for org_file, org_links in by_org.items():
+        broken = [link for link in org_links if not results[link.url].ok]
+        report += (
+            f"\n## {org_links[0].org_name} (`{org_file}`)\n\n"
+            f"Sprawdzone linki: {len(org_links)}, niedziałające: {len(broken)}\n"
+        )
+        for link in broken:
+            result = results[link.url]
+            reason = result.status if result.status is not None else result.error
+            report += f"- **{link.product_name}**: {link.url} ({reason})\n"
+    return report
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Answers requests for `/<quoted original url>` with the status configured
+    for the original URL (200 by default). A configured `head` status is used
+    for HEAD requests only, e.g. 405 to exercise the GET fallback.
+    """
+
+    responses: ClassVar[dict[str, dict[str, int]]] = {}
+
+    def _respond(self, method: str):
+        url = unquote(self.path.lstrip("/"))
+        config = self.responses.get(url, {})
+        status = config.get(method.lower(), config.get("status", 200))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._respond("HEAD")
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def start_stub_server(responses: dict[str, dict[str, int]]) -> ThreadingHTTPServer:
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"responses": responses})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@click.command()
+@click.option(
+    "--organizations-dir",
+    default=ORGANIZATIONS_DIR,
+    show_default=True,
+    help="Directory with organization YAML files",
+)
+@click.option(
+    "--cache-file",
+    help=f"Path to the link check results cache "
+    f"[default: {CACHE_FILE}, or {STUB_CACHE_FILE} with --stub-responses]",
+)
+@click.option(
+    "--cache-ttl",
+    type=float,
+    default=24 * 60 * 60,
+    show_default=True,
+    help="Seconds after which a cached result expires",
+)
+@click.option("--workers", type=int, default=8, show_default=True)
+@click.option("--timeout", type=float, default=10.0, show_default=True)
+@click.option(
+    "--host-interval",
+    type=float,
+    default=1.0,
+    show_default=True,
+    help="Minimum seconds between requests to the same host",
+)
+@click.option("--output", type=click.Path(), help="Write the report to a file")
+@click.option(
+    "--stub-responses",
+    type=click.Path(exists=True),
+    help="JSON file mapping links to stub statuses; "
+    "checks run against a local stub HTTP server instead of the real hosts",
+)
+@click.option("--fail-on-broken", is_flag=True, help="Exit with 1 on broken links")
+def check_product_links(
+    organizations_dir,
+    cache_file,
+    cache_ttl,
+    workers,
+    timeout,
+    host_interval,
+    output,
+    stub_responses,
+    fail_on_broken,
+):
+    links = extract_product_links(organizations_dir)
+    if cache_file is None:
+        cache_file = STUB_CACHE_FILE if stub_responses else CACHE_FILE
+    cache = LinkCheckCache(cache_file, ttl=cache_ttl)
+
+    rewrite_url = None
+    if stub_responses:
+        with open(stub_responses) as f:
+            server = start_stub_server(json.load(f))
+        stub_url = f"http://127.0.0.1:{server.server_address[1]}"
+        logger.info(f"Using stub HTTP server at {stub_url}")
+
+        def rewrite_url(url):
+            return f"{stub_url}/{quote(url, safe='')}"
+
+    checker = LinkChecker(
+        workers=workers,
+        timeout=timeout,
+        host_interval=host_interval,
+        rewrite_url=rewrite_url,
+    )
+    results = checker.check_all([link.url for link in links], cache)
+    cache.save()
+
+    report = render_report(links, results)
+    if output:
+        with open(output, "w") as f:
+            f.write(report)
+    else:
+        click.echo(report)
+
+    if fail_on_broken and not all(results[link.url].ok for link in links):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    check_product_links()
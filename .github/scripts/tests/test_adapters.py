@@ -0,0 +1,85 @@
+from adapters import ProductsAdapter
+
+
+def products(data: str) -> list[dict[str, str]]:
+    return ProductsAdapter(data).products
+
+
+def test_product_with_and_without_link():
+    assert products("Produkt 1 https://allegro.pl/oferta/1\nProdukt 2") == [
+        {"nazwa": "Produkt 1", "link": "https://allegro.pl/oferta/1"},
+        {
+            "nazwa": "Produkt 2",
+            "link": "https://allegro.pl/listing?string=Produkt%202",
+        },
+    ]
+
+
+def test_indented_lines_are_separate_products():
+    assert [
+        product["nazwa"] for product in products("Produkt 1\n  Produkt 2\n  Produkt 3")
+    ] == ["Produkt 1", "Produkt 2", "Produkt 3"]
+    assert all("opis" not in product for product in products("A\n  B\n  C"))
+
+
+def test_bullets_and_checkboxes_are_stripped():
+    data = (
+        "- Produkt 1\n* Produkt 2\n+ Produkt 3\n1. Produkt 4\n2) Produkt 5\n"
+        "- [ ] Produkt 6\n- [x] Produkt 7"
+    )
+    assert [product["nazwa"] for product in products(data)] == [
+        f"Produkt {i}" for i in range(1, 8)
+    ]
+
+
+def test_empty_list_items_are_skipped():
+    assert [product["nazwa"] for product in products("- [ ] \n-\n- [x]\n- A")] == ["A"]
+
+
+def test_indented_bullets_are_separate_products():
+    assert [product["nazwa"] for product in products("  - A\n  - B")] == ["A", "B"]
+
+
+def test_description_with_prefix():
+    assert products("Karma\nopis: w dowolnym smaku")[0]["opis"] == "w dowolnym smaku"
+    assert products("Karma\n  Opis:  mokra\n  opis: sucha")[0]["opis"] == "mokra sucha"
+
+
+def test_description_before_any_product_is_dropped():
+    assert products("opis: foo\nKarma") == [
+        {"nazwa": "Karma", "link": "https://allegro.pl/listing?string=Karma"}
+    ]
+
+
+def test_description_nested_under_bullet():
+    assert products(
+        "- Karma https://allegro.pl/a\n    w dowolnym   smaku\n- Żwirek"
+    ) == [
+        {
+            "nazwa": "Karma",
+            "link": "https://allegro.pl/a",
+            "opis": "w dowolnym smaku",
+        },
+        {
+            "nazwa": "Żwirek",
+            "link": "https://allegro.pl/listing?string=%C5%BBwirek",
+        },
+    ]
+
+
+def test_www_link_gets_https_scheme():
+    assert products("Podkłady www.zooplus.pl/podklady")[0] == {
+        "nazwa": "Podkłady",
+        "link": "https://www.zooplus.pl/podklady",
+    }
+
+
+def test_url_like_word_stays_in_name():
+    assert products("Karma https:// marki X")[0]["nazwa"] == "Karma https:// marki X"
+    assert products("Karma Zooplus.pl")[0]["nazwa"] == "Karma Zooplus.pl"
+
+
+def test_empty_input():
+    assert products("") == []
+    assert products(None) == []
+    assert products("\n  \n") == []
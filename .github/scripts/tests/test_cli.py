@@ -0,0 +1,141 @@
+import importlib
+import json
+import os
+from types import SimpleNamespace
+
+import github
+import pytest
+
+from exceptions import BranchUpdateConflictError
+from indexes import OrganizationIndex
+from labels import Label
+from validators import OrgIssueValidator
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BOT_LOGIN = "wyslijco-bot"
+
+FORM_DATA = {
+    "Nazwa Twojej organizacji": "Nowa Organizacja Testowa",
+    "Adres strony internetowej Twojej organizacji": "https://example.com",
+    "KRS przypisany do Twojej organizacji": "0000999999",
+    "Nazwa Twojej strony w Wyślij.co": "nowej-organizacji",
+    "Ulica i numer budynku/lokalu": "Testowa 1",
+    "Kod Pocztowy": "00-001",
+    "Miasto": "Warszawa",
+    "Adres email dla firmy kurierskiej": "kontakt@example.com",
+    "Telefon kontaktowy dla kuriera": "123456789",
+    "Kod paczkomatu": "WAW01M",
+    "Dodatkowe informacje dla dostawcy": "_No response_",
+    "Lista produktów": "Karma",
+}
+
+
+class FakeComment:
+    def __init__(self, login: str, body: str):
+        self.user = SimpleNamespace(login=login)
+        self.body = body
+
+    def edit(self, body: str):
+        self.body = body
+
+
+class FakeIssue:
+    number = 1
+    title = "[Nowa Organizacja] Nowa Organizacja Testowa"
+    user = SimpleNamespace(login="author")
+
+    def __init__(self):
+        self.labels = []
+        self.comments = []
+
+    def edit(self, title):
+        self.title = title
+
+    def add_to_labels(self, label):
+        self.labels.append(SimpleNamespace(name=label))
+
+    def remove_from_labels(self, label):
+        self.labels = [ilabel for ilabel in self.labels if ilabel.name != label]
+
+    def get_comments(self):
+        return self.comments
+
+    def create_comment(self, body):
+        self.comments.append(FakeComment(BOT_LOGIN, body))
+
+    @property
+    def label_names(self):
+        return {label.name for label in self.labels}
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Runs the pipeline for a single issue with GitHub and KRS calls faked."""
+    monkeypatch.chdir(SCRIPTS_DIR)
+    monkeypatch.setenv("GITHUB_PAT", "token")
+    monkeypatch.setenv("GITHUB_REPOSITORY", "wyslijco/wyslijco")
+    monkeypatch.setattr(github.Github, "get_repo", lambda self, name: None)
+    cli = importlib.import_module("cli")
+
+    issue = FakeIssue()
+    commits = []
+    monkeypatch.setattr(
+        cli, "g", SimpleNamespace(get_user=lambda: SimpleNamespace(login=BOT_LOGIN))
+    )
+    monkeypatch.setattr(cli, "repo", SimpleNamespace(get_issue=lambda number: issue))
+    monkeypatch.setattr(
+        cli,
+        "OrgIssueValidator",
+        lambda data, issue: OrgIssueValidator(data, issue, OrganizationIndex()),
+    )
+    monkeypatch.setattr(
+        cli.KRSDataPuller,
+        "get_org_by_krs",
+        lambda issue, krs: SimpleNamespace(name="FUNDACJA TESTOWA"),
+    )
+    monkeypatch.setattr(
+        cli,
+        "create_organization_yaml_pr",
+        lambda issue, yaml_string, data: commits.append(yaml_string),
+    )
+
+    def run(**form_data):
+        cli.run_new_org_issue_pipeline(
+            cli.Tracer("test"), json.dumps({**FORM_DATA, **form_data}), issue.number
+        )
+        return commits
+
+    run.issue = issue
+    return run
+
+
+def test_reverting_to_processed_data_after_invalid_edit_is_processed_again(pipeline):
+    krs_label = "KRS przypisany do Twojej organizacji"
+    assert len(pipeline()) == 1
+    assert Label.AUTO_VERIFIED in pipeline.issue.label_names
+
+    pipeline(**{krs_label: "00009999"})
+    assert Label.INVALID_KRS in pipeline.issue.label_names
+    assert Label.AUTO_VERIFIED not in pipeline.issue.label_names
+
+    assert len(pipeline()) == 2
+    assert Label.INVALID_KRS not in pipeline.issue.label_names
+    assert Label.AUTO_VERIFIED in pipeline.issue.label_names
+
+
+def test_unchanged_processed_data_is_skipped(pipeline):
+    pipeline()
+    assert len(pipeline()) == 1
+
+
+def test_branch_update_conflict_is_reported_on_the_issue(pipeline, monkeypatch):
+    cli = importlib.import_module("cli")
+
+    def conflict(issue, yaml_string, data):
+        raise BranchUpdateConflictError()
+
+    monkeypatch.setattr(cli, "create_organization_yaml_pr", conflict)
+    pipeline()
+
+    assert "Aktualizacja pliku organizacji" in pipeline.issue.comments[-1].body
+    assert "status: pending" in pipeline.issue.comments[0].body
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import pytest
+from github.GithubException import GithubException
+
+from exceptions import BranchUpdateConflictError
+from git_managers import BRANCH_UPDATE_ATTEMPTS, GitManager
+
+BRANCH = "nowa-organizacja-zgloszenie-1"
+
+
+class FakeRef:
+    def __init__(self, repo: "FakeRepo", sha: str):
+        self.repo = repo
+        self.ref = f"refs/heads/{BRANCH}"
+        self.object = SimpleNamespace(sha=sha)
+
+    def edit(self, sha: str, force: bool = False):
+        self.repo.before_edit()
+        if self.object.sha != self.repo.head:
+            raise GithubException(422, {"message": "Update is not a fast forward"})
+        self.repo.head = sha
+
+
+class FakeRepo:
+    """Repository with a single branch, moved by `concurrent_pushes` other runs."""
+
+    def __init__(self, concurrent_pushes: int = 0, move_before_edit: bool = True):
+        self.head = "main"
+        self.commits = 0
+        self.concurrent_pushes = concurrent_pushes
+        self.move_before_edit = move_before_edit
+
+    def _concurrent_push(self):
+        if self.concurrent_pushes:
+            self.concurrent_pushes -= 1
+            self.head = f"concurrent-{self.concurrent_pushes}"
+
+    def before_edit(self):
+        if self.move_before_edit:
+            self._concurrent_push()
+
+    def get_branch(self, name):
+        return SimpleNamespace(commit=SimpleNamespace(sha="main"))
+
+    def get_git_ref(self, ref):
+        ref = FakeRef(self, self.head)
+        if not self.move_before_edit:
+            self._concurrent_push()
+        return ref
+
+    def get_commit(self, sha):
+        return SimpleNamespace(
+            sha=sha, commit=SimpleNamespace(tree="tree", message=f"[auto] {sha}")
+        )
+
+    def create_git_blob(self, contents, encoding):
+        return SimpleNamespace(sha="blob")
+
+    def create_git_tree(self, elements, base_tree):
+        return "tree"
+
+    def create_git_commit(self, message, tree, parents):
+        self.commits += 1
+        return SimpleNamespace(sha=f"commit-{self.commits}")
+
+
+def update(repo: FakeRepo):
+    return GitManager(repo).create_or_update_remote_branch_with_file_commit(
+        "main", BRANCH, "organizations/nowej.yaml", "nazwa: Nowa", "[auto] Nowa"
+    )
+
+
+def test_branch_is_updated_without_conflicts():
+    repo = FakeRepo()
+    update(repo)
+
+    assert repo.head == "commit-1"
+
+
+@pytest.mark.parametrize("move_before_edit", [True, False])
+def test_commit_is_recreated_when_branch_moves_before_the_update(move_before_edit):
+    repo = FakeRepo(concurrent_pushes=1, move_before_edit=move_before_edit)
+    update(repo)
+
+    assert repo.head == "commit-2"
+
+
+def test_conflict_is_raised_when_branch_keeps_moving():
+    repo = FakeRepo(concurrent_pushes=BRANCH_UPDATE_ATTEMPTS)
+
+    with pytest.raises(BranchUpdateConflictError):
+        update(repo)
+    assert repo.head.startswith("concurrent-")
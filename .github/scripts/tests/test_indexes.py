@@ -0,0 +1,29 @@
+import os
+
+import yaml
+
+from consts import ORG_SCHEMA_NAME_FIELDS
+from indexes import OrganizationIndex
+
+ORGANIZATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "organizations"
+)
+
+
+def test_existing_organizations_are_not_similar_to_each_other():
+    index = OrganizationIndex.from_directory(ORGANIZATIONS_DIR)
+    for file_name in os.listdir(ORGANIZATIONS_DIR):
+        with open(os.path.join(ORGANIZATIONS_DIR, file_name)) as f:
+            org_data = yaml.safe_load(f)
+        for name_field in ORG_SCHEMA_NAME_FIELDS:
+            if name := org_data.get(name_field):
+                matches = index.find_similar_names(name)
+                assert [match.file_name for match in matches] == [file_name]
+
+
+def test_similar_name_is_found_despite_common_words():
+    index = OrganizationIndex()
+    index.add("piozowi.yaml", {"nazwa": "Podlaski Inspektorat Ochrony Zwierząt"})
+
+    assert index.find_similar_names("Podlaski Inspektorat Ochrony Zwierzat")
+    assert not index.find_similar_names("Pomorski Inspektorat Ochrony Zwierząt")
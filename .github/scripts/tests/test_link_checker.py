@@ -0,0 +1,109 @@
+import time
+from urllib.parse import quote
+
+import pytest
+
+from link_checker import (
+    LinkCheckCache,
+    LinkChecker,
+    LinkCheckResult,
+    ProductLink,
+    render_report,
+    start_stub_server,
+)
+
+OK_URL = "https://sklep.example.com/ok"
+HEAD_NOT_ALLOWED_URL = "https://sklep.example.com/bez-head"
+BROKEN_URL = "https://sklep.example.com/brak"
+
+
+@pytest.fixture
+def checker():
+    server = start_stub_server(
+        {
+            HEAD_NOT_ALLOWED_URL: {"head": 405},
+            BROKEN_URL: {"status": 404},
+        }
+    )
+    stub_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield LinkChecker(
+        workers=2,
+        timeout=5,
+        host_interval=0,
+        rewrite_url=lambda url: f"{stub_url}/{quote(url, safe='')}",
+    )
+    server.shutdown()
+    server.server_close()
+
+
+def test_head_not_allowed_falls_back_to_get(checker):
+    result = checker.check(HEAD_NOT_ALLOWED_URL)
+
+    assert result.ok
+    assert (result.status, result.method) == (200, "GET")
+    assert checker.check(OK_URL).method == "HEAD"
+
+
+def test_cached_results_are_reused_until_they_expire(checker, tmp_path):
+    cache = LinkCheckCache(str(tmp_path / "cache.json"), ttl=60)
+    checker.check_all([OK_URL, BROKEN_URL], cache)
+    cache.save()
+
+    fresh = LinkCheckCache(str(tmp_path / "cache.json"), ttl=60)
+    assert fresh.get(OK_URL, time.time()).status == 200
+    assert fresh.get(OK_URL, time.time() + 61) is None
+
+
+def test_failed_results_are_not_cached(checker, tmp_path):
+    cache = LinkCheckCache(str(tmp_path / "cache.json"), ttl=60)
+    results = checker.check_all([BROKEN_URL], cache)
+
+    assert results[BROKEN_URL].status == 404
+    assert cache.get(BROKEN_URL, time.time()) is None
+
+    cache.set(
+        LinkCheckResult(
+            url=OK_URL,
+            ok=False,
+            status=None,
+            method="HEAD",
+            checked_at=time.time(),
+            error="timeout",
+        )
+    )
+    assert cache.get(OK_URL, time.time()) is None
+
+
+def test_check_all_skips_cached_links(checker, tmp_path):
+    cache = LinkCheckCache(str(tmp_path / "cache.json"), ttl=60)
+    cached = LinkCheckResult(
+        url=OK_URL, ok=True, status=299, method="HEAD", checked_at=time.time()
+    )
+    cache.set(cached)
+
+    assert checker.check_all([OK_URL], cache)[OK_URL] is cached
+
+
+def test_render_report_lists_broken_links_per_organization():
+    links = [
+        ProductLink("adzie.yaml", "Fundacja ADA", "Karma", OK_URL),
+        ProductLink("adzie.yaml", "Fundacja ADA", "Żwirek", BROKEN_URL),
+        ProductLink("medorowi.yaml", "MEDOR", "Koc", HEAD_NOT_ALLOWED_URL),
+    ]
+    results = {
+        OK_URL: LinkCheckResult(OK_URL, True, 200, "HEAD", 0),
+        BROKEN_URL: LinkCheckResult(BROKEN_URL, False, 404, "HEAD", 0),
+        HEAD_NOT_ALLOWED_URL: LinkCheckResult(
+            HEAD_NOT_ALLOWED_URL, False, None, "GET", 0, error="timeout"
+        ),
+    }
+
+    assert render_report(links, results) == (
+        "# Raport linków do produktów\n"
+        "\n## Fundacja ADA (`adzie.yaml`)\n\n"
+        "Sprawdzone linki: 2, niedziałające: 1\n"
+        f"- **Żwirek**: {BROKEN_URL} (404)\n"
+        "\n## MEDOR (`medorowi.yaml`)\n\n"
+        "Sprawdzone linki: 1, niedziałające: 1\n"
+        f"- **Koc**: {HEAD_NOT_ALLOWED_URL} (timeout)\n"
+    )
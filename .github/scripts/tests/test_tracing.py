@@ -0,0 +1,87 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from tracing import HttpCall, Span, Tracer
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_calls_are_attributed_to_the_open_span(server_url):
+    original_send = requests.Session.send
+    tracer = Tracer("test")
+
+    with tracer.instrument_http():
+        requests.get(f"{server_url}/przed?token=secret")
+        with tracer.span("krs"):
+            requests.get(f"{server_url}/krs?krs=0000313847")
+            requests.get(f"{server_url}/krs")
+
+    assert requests.Session.send is original_send
+    spans = {span.name: span for span in tracer.spans}
+    assert [call.url for call in spans["untraced"].calls] == [f"{server_url}/przed"]
+    assert [call.url for call in spans["krs"].calls] == [f"{server_url}/krs"] * 2
+    assert {
+        (call.service, call.method, call.status) for call in spans["krs"].calls
+    } == {("127.0.0.1", "GET", 200)}
+
+
+def test_send_is_restored_when_the_instrumented_block_fails():
+    original_send = requests.Session.send
+
+    with pytest.raises(RuntimeError):
+        with Tracer("test").instrument_http():
+            raise RuntimeError()
+
+    assert requests.Session.send is original_send
+
+
+def test_failed_span_is_recorded_with_the_error():
+    tracer = Tracer("test")
+
+    with pytest.raises(ValueError):
+        with tracer.span("validation"):
+            raise ValueError("zły KRS")
+
+    assert tracer.spans[0].error == "ValueError('zły KRS')"
+    assert tracer.spans[0].end is not None
+
+
+def test_to_markdown_table():
+    tracer = Tracer("Przetwarzanie zgłoszenia #1")
+    github_call = HttpCall("github", "GET", "https://api.github.com/x", 200, 10.4)
+    krs_call = HttpCall("krs", "GET", "https://api-krs.ms.gov.pl/x", 200, 30.0)
+    tracer.spans = [
+        Span("form parsing", start=0.0, end=0.5, calls=[github_call, github_call]),
+        Span(
+            "krs", start=0.5, end=1.0, error="KRSMaintenanceError()", calls=[krs_call]
+        ),
+    ]
+
+    assert tracer.to_markdown() == (
+        "### Przetwarzanie zgłoszenia #1\n"
+        "\n"
+        "| Etap | Czas [ms] | github (liczba / ms) | krs (liczba / ms) |\n"
+        "|---|---|---|---|\n"
+        "| form parsing | 500 | 2 / 21 | - |\n"
+        "| krs ❌ | 500 | - | 1 / 30 |\n"
+    )
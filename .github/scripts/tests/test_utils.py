@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+from utils import (
+    FORM_DATA_STATUS_PENDING,
+    get_form_data_hash,
+    get_last_processed_form_data_hash,
+    set_last_processed_form_data_hash,
+)
+
+BOT_LOGIN = "wyslijco-bot"
+
+
+class FakeComment:
+    def __init__(self, login: str, body: str):
+        self.user = SimpleNamespace(login=login)
+        self.body = body
+
+    def edit(self, body: str):
+        self.body = body
+
+
+class FakeIssue:
+    def __init__(self, comments=None):
+        self.comments = comments or []
+
+    def get_comments(self):
+        return self.comments
+
+    def create_comment(self, body: str):
+        self.comments.append(FakeComment(BOT_LOGIN, body))
+
+
+def test_form_data_hash_ignores_key_order():
+    assert get_form_data_hash({"a": 1, "b": 2}) == get_form_data_hash({"b": 2, "a": 1})
+
+
+def test_stored_hash_is_read_back_and_updated_in_place():
+    issue = FakeIssue()
+    set_last_processed_form_data_hash(issue, "abc", BOT_LOGIN)
+    set_last_processed_form_data_hash(issue, "def", BOT_LOGIN)
+
+    assert len(issue.comments) == 1
+    assert get_last_processed_form_data_hash(issue, BOT_LOGIN) == "def"
+
+
+def test_hash_comments_from_other_users_are_ignored():
+    issue = FakeIssue(
+        [FakeComment("author", "<!-- form-data-hash: abc status: processed -->")]
+    )
+
+    assert get_last_processed_form_data_hash(issue, BOT_LOGIN) is None
+
+
+def test_deleting_the_hash_comment_forces_reprocessing():
+    issue = FakeIssue()
+    set_last_processed_form_data_hash(issue, "abc", BOT_LOGIN)
+    issue.comments.clear()
+
+    assert get_last_processed_form_data_hash(issue, BOT_LOGIN) is None
+
+
+def test_pending_hash_is_not_treated_as_processed():
+    issue = FakeIssue()
+    set_last_processed_form_data_hash(issue, "abc", BOT_LOGIN)
+    set_last_processed_form_data_hash(
+        issue, "def", BOT_LOGIN, status=FORM_DATA_STATUS_PENDING
+    )
+
+    assert len(issue.comments) == 1
+    assert get_last_processed_form_data_hash(issue, BOT_LOGIN) is None
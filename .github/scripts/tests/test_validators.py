@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+from consts import OrgFormSchemaIds
+from indexes import OrganizationIndex
+from labels import Label
+from validators import OrgIssueValidator
+
+EXISTING_ORGANIZATION = {
+    "nazwa": "Fundacja ADA",
+    "adres": "adzie",
+    "krs": "0000313847",
+    "nazwa_w_krs": "FUNDACJA ADA",
+}
+
+VALID_DATA = {
+    OrgFormSchemaIds.name: "Nowa Organizacja Testowa",
+    OrgFormSchemaIds.krs: "0000999999",
+    OrgFormSchemaIds.postal_code: "00-001",
+    OrgFormSchemaIds.phone_number: "123456789",
+    OrgFormSchemaIds.slug: "nowej-organizacji",
+}
+
+
+class FakeData:
+    def __init__(self, values: dict[str, str]):
+        self.values = values
+
+    def get(self, identifier: str) -> str:
+        return self.values.get(identifier, "")
+
+    def get_label(self, identifier: str) -> str:
+        return identifier
+
+
+class FakeIssue:
+    def __init__(self, labels=()):
+        self.labels = [SimpleNamespace(name=label) for label in labels]
+        self.comments = []
+
+    def add_to_labels(self, label):
+        self.labels.append(SimpleNamespace(name=label))
+
+    def remove_from_labels(self, label):
+        self.labels = [ilabel for ilabel in self.labels if ilabel.name != label]
+
+    def create_comment(self, body):
+        self.comments.append(body)
+
+    @property
+    def label_names(self):
+        return {label.name for label in self.labels}
+
+
+def make_validator(issue, **overrides):
+    index = OrganizationIndex()
+    index.add("adzie.yaml", EXISTING_ORGANIZATION)
+    return OrgIssueValidator(FakeData({**VALID_DATA, **overrides}), issue, index)
+
+
+def test_valid_data_adds_no_labels_and_no_comments():
+    issue = FakeIssue()
+    validator = make_validator(issue)
+
+    assert validator.validate()
+    assert issue.label_names == set()
+    assert issue.comments == []
+    assert validator.warnings == []
+
+
+def test_valid_data_removes_stale_labels():
+    issue = FakeIssue([Label.INVALID_KRS, Label.POSSIBLE_DUPLICATE])
+
+    assert make_validator(issue).validate()
+    assert issue.label_names == set()
+
+
+def test_duplicate_krs_is_reported_under_krs_field():
+    issue = FakeIssue()
+
+    assert not make_validator(
+        issue, **{OrgFormSchemaIds.krs: EXISTING_ORGANIZATION["krs"]}
+    ).validate()
+    assert issue.label_names == {Label.INVALID_KRS}
+    assert f"**{OrgFormSchemaIds.krs}**" in issue.comments[0]
+    assert "adzie.yaml" in issue.comments[0]
+
+
+def test_similar_name_is_a_warning():
+    issue = FakeIssue()
+    validator = make_validator(issue, **{OrgFormSchemaIds.name: "Fundacja Ada"})
+
+    assert validator.validate()
+    assert issue.label_names == {Label.POSSIBLE_DUPLICATE}
+    assert len(validator.warnings) == 1
+    assert len(issue.comments) == 1
+
+
+def test_existing_slug_is_an_error():
+    issue = FakeIssue()
+
+    assert not make_validator(issue, **{OrgFormSchemaIds.slug: "adzie"}).validate()
+    assert issue.label_names == {Label.INVALID_SLUG}
@@ -0,0 +1,172 @@
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__file__)
+
+# Outbound hosts grouped under a service name in the trace
+SERVICE_HOSTS = {
+    "api.github.com": "github",
+    "api-krs.ms.gov.pl": "krs",
+}
+
+
+@dataclass
+class HttpCall:
+    service: str
+    method: str
+    url: str
+    status: int | None
+    duration_ms: float
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    end: float | None = None
+    error: str = ""
+    calls: list[HttpCall] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end or time.perf_counter()) - self.start) * 1000
+
+    def calls_summary(self) -> dict[str, dict[str, float]]:
+        summary = {}
+        for call in self.calls:
+            service = summary.setdefault(call.service, {"count": 0, "total_ms": 0.0})
+            service["count"] += 1
+            service["total_ms"] += call.duration_ms
+        return summary
+
+
+class Tracer:
+    """
+    Records timed spans around the stages of a pipeline run, together with
+    every outbound HTTP call (GitHub API, KRS API) made while a span is open.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = time.time()
+        self.spans: list[Span] = []
+        self._current: Span | None = None
+
+    @contextmanager
+    def span(self, name: str):
+        span = Span(name=name, start=time.perf_counter())
+        previous, self._current = self._current, span
+        self.spans.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = repr(e)
+            raise
+        finally:
+            span.end = time.perf_counter()
+            self._current = previous
+            logger.info(f"Stage '{name}' took {span.duration_ms:.0f} ms")
+
+    def record_call(self, call: HttpCall):
+        if self._current is None:
+            self.span_for_untraced().calls.append(call)
+        else:
+            self._current.calls.append(call)
+
+    def span_for_untraced(self) -> Span:
+        for span in self.spans:
+            if span.name == "untraced":
+                return span
+        span = Span(name="untraced", start=time.perf_counter())
+        span.end = span.start
+        self.spans.append(span)
+        return span
+
+    @contextmanager
+    def instrument_http(self):
+        """Times every request sent through `requests` (used by PyGithub too)."""
+        original_send = requests.Session.send
+        tracer = self
+
+        def send(session, request, **kwargs):
+            start = time.perf_counter()
+            status = None
+            try:
+                response = original_send(session, request, **kwargs)
+                status = response.status_code
+                return response
+            finally:
+                host = urlparse(request.url).hostname or ""
+                tracer.record_call(
+                    HttpCall(
+                        service=SERVICE_HOSTS.get(host, host),
+                        method=request.method,
+                        url=request.url.split("?")[0],
+                        status=status,
+                        duration_ms=(time.perf_counter() - start) * 1000,
+                    )
+                )
+
+        requests.Session.send = send
+        try:
+            yield self
+        finally:
+            requests.Session.send = original_send
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "started_at": self.started_at,
+            "spans": [
+                {
+                    "name": span.name,
+                    "duration_ms": round(span.duration_ms, 1),
+                    "error": span.error,
+                    "calls_summary": span.calls_summary(),
+                    "calls": [asdict(call) for call in span.calls],
+                }
+                for span in self.spans
+            ],
+        }
+
+    def to_markdown(self) -> str:
+        services = sorted({call.service for span in self.spans for call in span.calls})
+        header = ["Etap", "Czas [ms]"] + [
+            f"{service} (liczba / ms)" for service in services
+        ]
+        lines = [
+            f"### {self.name}",
+            "",
+            "| " + " | ".join(header) + " |",
+            "|" + "---|" * len(header),
+        ]
+        for span in self.spans:
+            summary = span.calls_summary()
+            cells = [
+                span.name + (" ❌" if span.error else ""),
+                f"{span.duration_ms:.0f}",
+            ] + [
+                f"{summary[service]['count']} / {summary[service]['total_ms']:.0f}"
+                if service in summary
+                else "-"
+                for service in services
+            ]
+            lines.append("| " + " | ".join(cells) + " |")
+        return "\n".join(lines) + "\n"
+
+    def export(self, trace_file: str | None):
+        if trace_file:
+            with open(trace_file, "w") as f:
+                json.dump(self.to_dict(), f, indent=2)
+            logger.info(f"Trace written to {trace_file}")
+
+        if summary_file := os.getenv("GITHUB_STEP_SUMMARY"):
+            with open(summary_file, "a") as f:
+                f.write(self.to_markdown())
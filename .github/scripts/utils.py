@@ -1,5 +1,75 @@
+import hashlib
+import json
+import re
+
 from labels import Label
 
+FORM_DATA_HASH_COMMENT_PATTERN = re.compile(
+    r"<!-- form-data-hash: (\w+) status: (\w+) -->"
+)
+
+FORM_DATA_STATUS_PENDING = "pending"
+FORM_DATA_STATUS_PROCESSED = "processed"
+
 
 def has_label(issue, label: Label):
     return any([ilabel for ilabel in issue.labels if ilabel.name == label])
+
+
+def get_form_data_hash(form_data: dict) -> str:
+    serialized = json.dumps(form_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def find_form_data_hash_comment(issue, bot_login: str):
+    """
+    Returns the comment storing the hash of the last processed form data.
+
+    Only comments written by the bot are taken into account, so nobody else
+    can mark the form data as already processed.
+    """
+    for comment in issue.get_comments():
+        if comment.user.login != bot_login:
+            continue
+        if FORM_DATA_HASH_COMMENT_PATTERN.search(comment.body or ""):
+            return comment
+    return None
+
+
+def get_last_processed_form_data_hash(issue, bot_login: str) -> str | None:
+    """
+    Returns the hash of the form data of the last run, but only when that run
+    processed the data successfully.
+    """
+    if comment := find_form_data_hash_comment(issue, bot_login):
+        match = FORM_DATA_HASH_COMMENT_PATTERN.search(comment.body)
+        if match.group(2) == FORM_DATA_STATUS_PROCESSED:
+            return match.group(1)
+    return None
+
+
+def set_last_processed_form_data_hash(
+    issue,
+    form_data_hash: str,
+    bot_login: str,
+    status: str = FORM_DATA_STATUS_PROCESSED,
+):
+    """
+    Records the form data handled by the current run. A run marks the data as
+    pending before it changes anything on the issue, so a failed or partial run
+    always overwrites the hash of the last successfully processed data.
+    """
+    description = (
+        "Przetworzona wersja zgłoszenia"
+        if status == FORM_DATA_STATUS_PROCESSED
+        else "Przetwarzana wersja zgłoszenia"
+    )
+    body = (
+        f"<!-- form-data-hash: {form_data_hash} status: {status} -->\n"
+        f"{description}: `{form_data_hash[:12]}`\n\n"
+        "Usunięcie tego komentarza wymusi ponowne przetworzenie zgłoszenia."
+    )
+    if comment := find_form_data_hash_comment(issue, bot_login):
+        comment.edit(body)
+    else:
+        issue.create_comment(body)
@@ -1,12 +1,11 @@
-import os
 import re
 from dataclasses import dataclass
 
-import yaml
 from github import Issue
 
-from consts import OrgFormSchemaIds, ORG_SCHEMA_SLUG_FIELD
-from labels import INVALID_FIELD_TO_LABEL
+from consts import OrgFormSchemaIds
+from indexes import OrganizationIndex
+from labels import INVALID_FIELD_TO_LABEL, Label
 from parsers import GithubIssueFormDataParser
 from utils import has_label
 
@@ -15,12 +14,30 @@ from utils import has_label
 class OrgIssueValidator:
     data: GithubIssueFormDataParser
     issue: Issue
+    index: OrganizationIndex | None = None
+
+    def __post_init__(self):
+        if self.index is None:
+            self.index = OrganizationIndex.from_directory()
+        # non-blocking issues found by the last `validate` call
+        self.warnings: list[str] = []
 
     def validate_krs(self) -> tuple[bool, str]:
-        return (
-            bool(re.fullmatch(r"\d{10}", self.data.get(OrgFormSchemaIds.krs))),
-            "niepoprawny numer KRS",
-        )
+        """
+        Checks the KRS number format and whether an organization with the same
+        KRS number is already registered (possibly under a different slug).
+        """
+        krs = self.data.get(OrgFormSchemaIds.krs)
+        if not re.fullmatch(r"\d{10}", krs):
+            return False, "niepoprawny numer KRS"
+
+        if file_name := self.index.find_by_krs(krs):
+            return (
+                False,
+                f"organizacja z numerem KRS `{krs}` już istnieje w `wyślij.co` (`{file_name}`).",
+            )
+
+        return True, ""
 
     def validate_postal_code(self) -> tuple[bool, str]:
         return (
@@ -53,15 +70,11 @@ class OrgIssueValidator:
             "organizacje",
         }
 
-        for root, _, files in os.walk("../../organizations"):
-            for file_name in files:
-                with open(os.path.join(root, file_name), "r") as f:
-                    org_data = yaml.safe_load(f)
-                    if org_data[ORG_SCHEMA_SLUG_FIELD] == slug_value:
-                        return (
-                            False,
-                            f"organizacja z adresem `/{slug_value}` już istnieje w `wyślij.co`. Proszę zmienić wartość na inną.",
-                        )
+        if self.index.find_by_slug(slug_value):
+            return (
+                False,
+                f"organizacja z adresem `/{slug_value}` już istnieje w `wyślij.co`. Proszę zmienić wartość na inną.",
+            )
 
         if slug_value in reserved_slugs:
             return (
@@ -71,6 +84,25 @@ class OrgIssueValidator:
 
         return True, ""
 
+    def check_duplicates(self) -> list[str]:
+        """
+        Checks if organizations with a similar name are already registered.
+
+        Similar names don't make the data invalid, so they are returned as
+        warnings for manual review instead of validation errors.
+        """
+        matches = self.index.find_similar_names(self.data.get(OrgFormSchemaIds.name))
+        if not matches:
+            return []
+
+        similar = ", ".join(f"{match.name} (`{match.file_name}`)" for match in matches)
+        return [
+            (
+                f"w `wyślij.co` istnieją organizacje o podobnej nazwie: {similar}. "
+                "Zgłoszenie zostanie sprawdzone ręcznie."
+            )
+        ]
+
     def validate(self) -> bool:
         """
         Validates the organization data.
@@ -102,6 +134,18 @@ class OrgIssueValidator:
                     )
                 )
 
+        self.warnings = self.check_duplicates()
+        if self.warnings:
+            self.issue.add_to_labels(Label.POSSIBLE_DUPLICATE)
+            msg = "Zgłoszenie wymaga dodatkowej weryfikacji:\n"
+            for warning in self.warnings:
+                msg += (
+                    f"- **{self.data.get_label(OrgFormSchemaIds.name)}**: {warning}\n"
+                )
+            self.issue.create_comment(msg)
+        elif has_label(self.issue, Label.POSSIBLE_DUPLICATE):
+            self.issue.remove_from_labels(Label.POSSIBLE_DUPLICATE)
+
         if errors:
             msg = (
                 "Wprowadzone dane są nieprawidłowe. Prosimy o wprowadzenie poprawek:\n"
@@ -3,3 +3,14 @@ import os
 ORGANIZATIONS_DIR_PATH = os.getenv("ORGANIZATIONS_DIR_PATH", "organizations")
 ORGANIZATIONS_SLUG_FIELD_NAME = os.getenv("ORGANIZATIONS_SLUG_FIELD_NAME", "adres")
 ORGANIZATIONS_NAME_FIELD_NAME = os.getenv("ORGANIZATIONS_NAME_FIELD_NAME", "nazwa")
+POSTAL_PREFIXES_DATASET_PATH = os.getenv(
+    "POSTAL_PREFIXES_DATASET_PATH",
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "data", "postal_prefixes.csv"
+    ),
+)
+POSTAL_INDEX_SHARD_SIZE = int(os.getenv("POSTAL_INDEX_SHARD_SIZE", "20"))
+
+DEPLOY_MANIFEST_FILENAME = "deploy-manifest.json"
+PREVIOUS_DEPLOY_MANIFEST_PATH = os.getenv("PREVIOUS_DEPLOY_MANIFEST_PATH")
+DEPLOY_DELTA_PATH = os.getenv("DEPLOY_DELTA_PATH")
@@ -0,0 +1,290 @@
+"""
+Load-test harness for the site's serving routes.
+
+Starts the Flask app from `server.py` in a separate process against a
+generated set of organizations, then runs every scenario at increasing
+concurrency and reports throughput, p50/p95/p99 latency and the server's
+memory growth.
+
+Usage:
+    python site/loadtest.py --org-counts 20 200 1000 --concurrency 1 8 32
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+import yaml
+
+SITE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Every fifth synthetic organization has an alias slug redirecting to the main one
+ALIAS_EVERY = 5
+
+
+@dataclass
+class Scenario:
+    name: str
+    paths: list[str]
+    expected_status: int
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    org_count: int
+    concurrency: int
+    requests: int
+    errors: int
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    rss_before_kb: int
+    rss_after_kb: int
+
+    @property
+    def rss_growth_kb(self) -> int:
+        return self.rss_after_kb - self.rss_before_kb
+
+
+def generate_organizations(directory: str, count: int, products: int = 10):
+    for i in range(count):
+        slug = f"organizacji-{i}"
+        data = {
+            "nazwa": f"Organizacja testowa {i}",
+            "adres": [slug, f"alias-{i}"] if i % ALIAS_EVERY == 0 else slug,
+            "strona": f"https://example.com/{i}",
+            "krs": f"{i:010d}",
+            "nazwa_w_krs": f"FUNDACJA TESTOWA {i}",
+            "dostawa": {
+                "ulica": f"Testowa {i}",
+                "kod": f"{i % 100:02d}-{i % 1000:03d}",
+                "miasto": "Warszawa",
+                "telefon": "500 000 000",
+                "email": f"kontakt{i}@example.com",
+                "kod_paczkomatu": "WAW01M",
+                "dodatkowe_informacje": None,
+            },
+            "produkty": [
+                {
+                    "nazwa": f"Produkt {j}",
+                    "link": f"https://allegro.pl/listing?string=Produkt%20{j}",
+                    "opis": f"Opis produktu {j}",
+                }
+                for j in range(products)
+            ],
+        }
+        with open(os.path.join(directory, f"{slug}.yaml"), "w") as f:
+            yaml.safe_dump(data, f, allow_unicode=True)
+
+
+def build_scenarios(org_count: int) -> list[Scenario]:
+    org_paths = [f"/organizacji-{i}/" for i in range(org_count)]
+    alias_paths = [f"/alias-{i}/" for i in range(0, org_count, ALIAS_EVERY)]
+    return [
+        Scenario("index", ["/"], 200),
+        Scenario("organizations list", ["/organizacje/"], 200),
+        Scenario("organization page", org_paths, 200),
+        Scenario("alias redirect", alias_paths, 302),
+        Scenario("not found", [f"/nieistniejaca-{i}/" for i in range(100)], 404),
+    ]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def rss_kb(pid: int) -> int:
+    """Resident memory of the process (Linux only, 0 elsewhere)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+class ServerProcess:
+    """Runs the site's Flask app in a subprocess with the given organizations."""
+
+    def __init__(self, organizations_dir: str):
+        self.port = free_port()
+        run_app = (
+            "from server import app; "
+            f"app.run(host='127.0.0.1', port={self.port}, "
+            "debug=False, use_reloader=False, threaded=True)"
+        )
+        self.process = subprocess.Popen(
+            [sys.executable, "-c", run_app],
+            cwd=SITE_DIR,
+            env={**os.environ, "ORGANIZATIONS_DIR_PATH": organizations_dir},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self._wait_until_ready()
+
+    def _wait_until_ready(self, timeout: float = 30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError("Server process exited during startup")
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.1)
+        raise TimeoutError("Server did not start in time")
+
+    @property
+    def rss_kb(self) -> int:
+        return rss_kb(self.process.pid)
+
+    def stop(self):
+        self.process.terminate()
+        self.process.wait()
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, round(percent / 100 * len(sorted_values) + 0.5) - 1)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def run_scenario(
+    port: int, scenario: Scenario, concurrency: int, duration: float
+) -> tuple[list[float], int]:
+    """Sends requests from `concurrency` keep-alive clients for `duration` seconds."""
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def worker(seed: int):
+        nonlocal errors
+        rng = random.Random(seed)
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        local_latencies, local_errors = [], 0
+        while time.monotonic() < deadline:
+            path = rng.choice(scenario.paths)
+            start = time.perf_counter()
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                response.read()
+                if response.status != scenario.expected_status:
+                    local_errors += 1
+                if response.will_close:
+                    connection.close()
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                connection.close()
+                continue
+            local_latencies.append((time.perf_counter() - start) * 1000)
+        connection.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    threads = [
+        threading.Thread(target=worker, args=(seed,)) for seed in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors
+
+
+def run_suite(
+    org_counts: list[int], concurrency_levels: list[int], duration: float
+) -> list[ScenarioResult]:
+    results = []
+    for org_count in org_counts:
+        with tempfile.TemporaryDirectory() as organizations_dir:
+            generate_organizations(organizations_dir, org_count)
+            server = ServerProcess(organizations_dir)
+            try:
+                for scenario in build_scenarios(org_count):
+                    for concurrency in concurrency_levels:
+                        rss_before = server.rss_kb
+                        latencies, errors = run_scenario(
+                            server.port, scenario, concurrency, duration
+                        )
+                        latencies.sort()
+                        result = ScenarioResult(
+                            scenario=scenario.name,
+                            org_count=org_count,
+                            concurrency=concurrency,
+                            requests=len(latencies),
+                            errors=errors,
+                            throughput_rps=round(len(latencies) / duration, 1),
+                            p50_ms=round(percentile(latencies, 50), 2),
+                            p95_ms=round(percentile(latencies, 95), 2),
+                            p99_ms=round(percentile(latencies, 99), 2),
+                            rss_before_kb=rss_before,
+                            rss_after_kb=server.rss_kb,
+                        )
+                        print(format_row(result), flush=True)
+                        results.append(result)
+            finally:
+                server.stop()
+    return results
+
+
+REPORT_HEADER = (
+    f"{'scenario':<20} {'orgs':>6} {'conc':>5} {'req':>7} {'err':>5} "
+    f"{'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rss +kB':>8}"
+)
+
+
+def format_row(result: ScenarioResult) -> str:
+    return (
+        f"{result.scenario:<20} {result.org_count:>6} {result.concurrency:>5} "
+        f"{result.requests:>7} {result.errors:>5} {result.throughput_rps:>8} "
+        f"{result.p50_ms:>8} {result.p95_ms:>8} {result.p99_ms:>8} "
+        f"{result.rss_growth_kb:>8}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--org-counts", type=int, nargs="+", default=[20, 200])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="Seconds per scenario run"
+    )
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    print(REPORT_HEADER, flush=True)
+    results = run_suite(args.org_counts, args.concurrency, args.duration)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                [
+                    {**asdict(result), "rss_growth_kb": result.rss_growth_kb}
+                    for result in results
+                ],
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
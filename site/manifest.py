@@ -0,0 +1,110 @@
+import hashlib
+import json
+import logging
+import os
+
+from config import DEPLOY_MANIFEST_FILENAME
+
+logger = logging.getLogger(__file__)
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(site_dir: str) -> dict[str, dict]:
+    """Maps every output file (relative path) to its content hash and size."""
+    manifest = {}
+    for root, _, files in os.walk(site_dir):
+        for file_name in files:
+            path = os.path.join(root, file_name)
+            relative_path = os.path.relpath(path, site_dir).replace(os.sep, "/")
+            if relative_path == DEPLOY_MANIFEST_FILENAME:
+                continue
+            manifest[relative_path] = {
+                "sha256": file_sha256(path),
+                "size": os.path.getsize(path),
+            }
+    return dict(sorted(manifest.items()))
+
+
+def compare_manifests(
+    previous: dict[str, dict], current: dict[str, dict]
+) -> dict[str, list[str]]:
+    return {
+        "added": sorted(current.keys() - previous.keys()),
+        "changed": sorted(
+            path
+            for path in current.keys() & previous.keys()
+            if current[path]["sha256"] != previous[path].get("sha256")
+        ),
+        "removed": sorted(previous.keys() - current.keys()),
+    }
+
+
+def load_manifest(path: str | None) -> dict[str, dict] | None:
+    """
+    Returns the files of a previous manifest, or None when it is missing or
+    unreadable; the delta is informational and must never fail the build.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            files = json.load(f)["files"]
+        if not isinstance(files, dict):
+            raise ValueError("'files' is not a mapping")
+        if not all(isinstance(entry, dict) for entry in files.values()):
+            raise ValueError("file entries are not mappings")
+        return files
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable previous manifest {path}: {e}")
+        return None
+
+
+def delta_to_markdown(delta: dict[str, list[str]], current: dict[str, dict]) -> str:
+    upload_size = sum(
+        current[path]["size"] for path in delta["added"] + delta["changed"]
+    )
+    lines = [
+        "### Zmiany w wygenerowanej stronie",
+        "",
+        f"Dodane: {len(delta['added'])}, zmienione: {len(delta['changed'])}, "
+        f"usunięte: {len(delta['removed'])} (do wysłania: {upload_size} B)",
+        "",
+    ]
+    for status, label in (("added", "+"), ("changed", "~"), ("removed", "-")):
+        lines += [f"- `{label} {path}`" for path in delta[status]]
+    return "\n".join(lines) + "\n"
+
+
+def write_deploy_manifest(
+    site_dir: str, previous_manifest_path: str | None, delta_path: str | None
+) -> dict[str, list[str]] | None:
+    """
+    Writes the manifest of the built site into the site directory and, when
+    the manifest of the previous deploy is available, the list of added,
+    changed and removed files to `delta_path`.
+    """
+    current = build_manifest(site_dir)
+    with open(os.path.join(site_dir, DEPLOY_MANIFEST_FILENAME), "w") as f:
+        json.dump({"files": current}, f, indent=2)
+
+    previous = load_manifest(previous_manifest_path)
+    if previous is None:
+        return None
+
+    delta = compare_manifests(previous, current)
+    if delta_path:
+        with open(delta_path, "w") as f:
+            json.dump(delta, f, indent=2)
+
+    if summary_file := os.getenv("GITHUB_STEP_SUMMARY"):
+        with open(summary_file, "a") as f:
+            f.write(delta_to_markdown(delta, current))
+
+    return delta
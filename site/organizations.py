@@ -27,6 +27,8 @@ class Organization:
     file: str
     name: str
     slugs: list[str]
+    postal_code: str | None = None
+    city: str | None = None
 
 
 def get_organizations() -> tuple[dict[str, Organization], dict[str, Organization]]:
@@ -48,6 +50,8 @@ def get_organizations() -> tuple[dict[str, Organization], dict[str, Organization
                 file=organization_file,
                 name=organization_data.get(ORGANIZATIONS_NAME_FIELD_NAME),
                 slugs=slugs,
+                postal_code=(organization_data.get("dostawa") or {}).get("kod"),
+                city=(organization_data.get("dostawa") or {}).get("miasto"),
             )
             organizations[organization_file] = organization
             slugs_map.update({slug: organization for slug in slugs})
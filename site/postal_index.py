@@ -0,0 +1,155 @@
+import csv
+import math
+import re
+from dataclasses import dataclass, field
+
+from config import POSTAL_INDEX_SHARD_SIZE, POSTAL_PREFIXES_DATASET_PATH
+from organizations import Organization
+
+POSTAL_CODE_PATTERN = re.compile(r"^(\d)(\d)-?(\d{3})$")
+EARTH_RADIUS_KM = 6371.0
+
+
+@dataclass(frozen=True)
+class PostalPrefix:
+    """Approximate centroid of the area covered by a two-digit postal code prefix."""
+
+    prefix: str
+    city: str
+    latitude: float
+    longitude: float
+
+
+def normalize_postal_code(postal_code: str | None) -> str | None:
+    """Returns the postal code in the `00-000` format or None when it is invalid."""
+    if not postal_code:
+        return None
+    match = POSTAL_CODE_PATTERN.match(postal_code.strip())
+    if not match:
+        return None
+    region, district, local = match.groups()
+    return f"{region}{district}-{local}"
+
+
+def load_postal_prefixes(
+    path: str = POSTAL_PREFIXES_DATASET_PATH,
+) -> dict[str, PostalPrefix]:
+    with open(path, encoding="utf-8") as dataset:
+        return {
+            row["prefiks"]: PostalPrefix(
+                prefix=row["prefiks"],
+                city=row["miejscowosc"],
+                latitude=float(row["szerokosc"]),
+                longitude=float(row["dlugosc"]),
+            )
+            for row in csv.DictReader(dataset)
+        }
+
+
+def haversine_km(a: PostalPrefix, b: PostalPrefix) -> float:
+    lat1, lon1, lat2, lon2 = map(
+        math.radians, (a.latitude, a.longitude, b.latitude, b.longitude)
+    )
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+def build_distance_table(
+    prefixes: dict[str, PostalPrefix],
+) -> dict[str, dict[str, float]]:
+    """Symmetric table of distances (in km) between all pairs of prefixes."""
+    table = {prefix: {prefix: 0.0} for prefix in prefixes}
+    ordered = sorted(prefixes)
+    for i, first in enumerate(ordered):
+        for second in ordered[i + 1 :]:
+            distance = round(haversine_km(prefixes[first], prefixes[second]), 1)
+            table[first][second] = distance
+            table[second][first] = distance
+    return table
+
+
+@dataclass
+class PostalCodeIndex:
+    """
+    Build-time index of organizations keyed on the postal code hierarchy:
+    region (first digit) -> district (two-digit prefix) -> full postal code.
+
+    Each district prefix gets its own small shard listing organizations from
+    that district by full postal code and the nearest organizations overall,
+    so a visitor's postal code is resolved by fetching a single shard.
+    """
+
+    prefixes: dict[str, PostalPrefix]
+    distances: dict[str, dict[str, float]]
+    regions: dict[str, dict[str, dict[str, list[Organization]]]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def build(
+        cls,
+        organizations: dict[str, Organization],
+        prefixes: dict[str, PostalPrefix] | None = None,
+    ) -> "PostalCodeIndex":
+        prefixes = prefixes if prefixes is not None else load_postal_prefixes()
+        index = cls(prefixes=prefixes, distances=build_distance_table(prefixes))
+        for organization in organizations.values():
+            index.add(organization)
+        return index
+
+    def add(self, organization: Organization):
+        postal_code = normalize_postal_code(organization.postal_code)
+        if not postal_code or postal_code[:2] not in self.prefixes:
+            return
+        region, district = postal_code[0], postal_code[:2]
+        codes = self.regions.setdefault(region, {}).setdefault(district, {})
+        codes.setdefault(postal_code, []).append(organization)
+
+    def _organizations_by_district(self) -> dict[str, list[tuple[str, Organization]]]:
+        by_district = {}
+        for districts in self.regions.values():
+            for district, codes in districts.items():
+                by_district[district] = [
+                    (code, organization)
+                    for code in sorted(codes)
+                    for organization in codes[code]
+                ]
+        return by_district
+
+    def shard(self, district: str, limit: int = POSTAL_INDEX_SHARD_SIZE) -> dict:
+        """Returns the JSON-serializable shard for the given two-digit prefix."""
+        if district not in self.prefixes:
+            raise KeyError(district)
+
+        distances = self.distances[district]
+        nearest = sorted(
+            (
+                (distances[org_district], code, organization)
+                for org_district, entries in self._organizations_by_district().items()
+                for code, organization in entries
+            ),
+            key=lambda entry: (entry[0], entry[1], entry[2].name),
+        )[:limit]
+
+        codes = self.regions.get(district[0], {}).get(district, {})
+        return {
+            "prefiks": district,
+            "miejscowosc": self.prefixes[district].city,
+            "kody": {
+                code: [organization.slugs[0] for organization in organizations]
+                for code, organizations in sorted(codes.items())
+            },
+            "najblizsze": [
+                {
+                    "adres": organization.slugs[0],
+                    "nazwa": organization.name,
+                    "kod": code,
+                    "miasto": organization.city,
+                    "odleglosc_km": distance,
+                }
+                for distance, code, organization in nearest
+            ],
+        }
@@ -1,10 +1,20 @@
 import os
 import sys
 
-from flask import Flask, abort, render_template, send_from_directory, url_for
+from flask import (
+    Flask,
+    abort,
+    jsonify,
+    render_template,
+    send_from_directory,
+    url_for,
+)
 from flask_frozen import Freezer, redirect  # Added
 
+from config import DEPLOY_DELTA_PATH, PREVIOUS_DEPLOY_MANIFEST_PATH
+from manifest import write_deploy_manifest
 from organizations import get_organization_data, get_organizations, Organization
+from postal_index import PostalCodeIndex
 
 DEBUG = True
 FREEZER_DESTINATION = "../_site"  # builds to the default desitination for GitHub Pages
@@ -15,6 +25,7 @@ freezer = Freezer(app)
 
 
 organizations, slug_to_organization = get_organizations()
+postal_code_index = PostalCodeIndex.build(organizations)
 
 
 def static_file(name: str):
@@ -80,6 +91,19 @@ def join():
     return render_template("join.html")
 
 
+@app.route("/kody/<string:prefix>.json")
+def postal_code_shard(prefix):
+    if prefix not in postal_code_index.prefixes:
+        abort(404)
+    return jsonify(postal_code_index.shard(prefix))
+
+
+@freezer.register_generator
+def postal_code_shard():  # noqa: F811
+    for prefix in postal_code_index.prefixes:
+        yield {"prefix": prefix}
+
+
 @app.route("/<string:org_name>/", strict_slashes=False)
 def organization_page(org_name):
     if org_name not in slug_to_organization:
@@ -105,5 +129,8 @@ def organization_page():  # noqa: F811
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "build":
         freezer.freeze()
+        write_deploy_manifest(
+            freezer.root, PREVIOUS_DEPLOY_MANIFEST_PATH, DEPLOY_DELTA_PATH
+        )
     else:
         app.run(host="0.0.0.0", port=8000)
@@ -147,6 +147,66 @@ function copyUrlFallback(url) {
   document.body.removeChild(textarea);
 }
 
+async function findNearestOrganizations(postalCode) {
+  const match = postalCode.trim().match(/^(\d{2})-?(\d{3})$/);
+  if (!match) {
+    return [];
+  }
+  const code = `${match[1]}-${match[2]}`;
+
+  // One small shard per two-digit postal code prefix, generated at build time
+  const response = await fetch(`/kody/${match[1]}.json`);
+  if (!response.ok) {
+    return [];
+  }
+  const shard = await response.json();
+
+  // Organizations with exactly the same postal code go first
+  const sameCode = new Set(shard.kody[code] || []);
+  return [
+    ...shard.najblizsze.filter(org => sameCode.has(org.adres)),
+    ...shard.najblizsze.filter(org => !sameCode.has(org.adres)),
+  ];
+}
+
+function handleNearestOrganizationsSubmit(event) {
+  event.preventDefault();
+  const postalCode = event.target.querySelector('input').value;
+  const list = document.getElementById('nearest-organizations');
+
+  const notFoundMessage = 'Nie znaleziono organizacji dla podanego kodu pocztowego.';
+
+  findNearestOrganizations(postalCode).then(organizations => {
+    list.innerHTML = '';
+    if (!organizations.length) {
+      list.textContent = notFoundMessage;
+      return;
+    }
+    organizations.forEach(org => {
+      const item = document.createElement('li');
+      item.className = 'org-list-item';
+
+      const link = document.createElement('a');
+      link.href = `/${org.adres}`;
+      link.className = 'org-list-link';
+      link.textContent = org.nazwa;
+
+      const distance = document.createElement('span');
+      distance.className = 'org-search-distance';
+      const approximateDistance = `~${Math.round(org.odleglosc_km)} km`;
+      distance.textContent = org.miasto ? `${org.miasto}, ${approximateDistance}` : approximateDistance;
+
+      item.appendChild(link);
+      item.appendChild(distance);
+      list.appendChild(item);
+    });
+  }).catch(() => {
+    // e.g. a network error or a malformed shard
+    list.textContent = notFoundMessage;
+  });
+  return false;
+}
+
 document.addEventListener('DOMContentLoaded', function() {
   if (isInAppBrowser()) {
     // Show banner for in-app browsers
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The site is run from its directory and imports its modules as top-level ones
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,66 @@
+import json
+import os
+
+from manifest import build_manifest, compare_manifests, load_manifest
+
+
+def write(path, contents: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(contents)
+
+
+def test_build_manifest_hashes_every_file_except_the_manifest(tmp_path):
+    write(tmp_path / "index.html", "<html></html>")
+    write(tmp_path / "kody" / "00.json", "{}")
+    write(tmp_path / "deploy-manifest.json", "{}")
+
+    manifest = build_manifest(str(tmp_path))
+
+    assert list(manifest) == ["index.html", "kody/00.json"]
+    assert manifest["kody/00.json"] == {
+        "sha256": "44136fa355b3678a1146ad16f7e8649e94fb4fc21fe77e8310c060f61caaff8a",
+        "size": 2,
+    }
+
+
+def test_compare_manifests():
+    previous = {
+        "changed.html": {"sha256": "a", "size": 1},
+        "removed.html": {"sha256": "b", "size": 1},
+        "same.html": {"sha256": "c", "size": 1},
+    }
+    current = {
+        "added.html": {"sha256": "d", "size": 1},
+        "changed.html": {"sha256": "e", "size": 1},
+        "same.html": {"sha256": "c", "size": 1},
+    }
+
+    assert compare_manifests(previous, current) == {
+        "added": ["added.html"],
+        "changed": ["changed.html"],
+        "removed": ["removed.html"],
+    }
+
+
+def test_load_manifest(tmp_path):
+    files = {"index.html": {"sha256": "a", "size": 1}}
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"files": files}))
+
+    assert load_manifest(str(path)) == files
+    assert load_manifest(None) is None
+    assert load_manifest(str(tmp_path / "missing.json")) is None
+
+
+def test_load_manifest_ignores_unexpected_contents(tmp_path):
+    path = tmp_path / "manifest.json"
+    for contents in (
+        "not json",
+        "[]",
+        '{"pliki": {}}',
+        '{"files": []}',
+        '{"files": {"index.html": "abc"}}',
+    ):
+        path.write_text(contents)
+        assert load_manifest(str(path)) is None
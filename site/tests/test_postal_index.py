@@ -0,0 +1,122 @@
+import pytest
+
+from organizations import Organization
+from postal_index import (
+    PostalCodeIndex,
+    PostalPrefix,
+    build_distance_table,
+    normalize_postal_code,
+)
+
+PREFIXES = {
+    "00": PostalPrefix("00", "Warszawa", 52.2297, 21.0122),
+    "05": PostalPrefix("05", "Piaseczno", 52.0800, 21.0200),
+    "30": PostalPrefix("30", "Kraków", 50.0647, 19.9450),
+    "80": PostalPrefix("80", "Gdańsk", 54.3520, 18.6466),
+}
+
+
+def organization(slug: str, postal_code: str | None) -> Organization:
+    return Organization(
+        file=f"{slug}.yaml",
+        name=slug.capitalize(),
+        slugs=[slug],
+        postal_code=postal_code,
+        city="Miasto",
+    )
+
+
+@pytest.mark.parametrize(
+    "postal_code, normalized",
+    [
+        ("00-950", "00-950"),
+        ("00950", "00-950"),
+        (" 30-001 ", "30-001"),
+        ("0-950", None),
+        ("00-95", None),
+        ("00 950", None),
+        ("ab-cde", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_normalize_postal_code(postal_code, normalized):
+    assert normalize_postal_code(postal_code) == normalized
+
+
+def test_distance_table_is_symmetric_with_zero_diagonal():
+    table = build_distance_table(PREFIXES)
+
+    for first in PREFIXES:
+        assert table[first][first] == 0.0
+        for second in PREFIXES:
+            assert table[first][second] == table[second][first]
+    assert 250 < table["00"]["30"] < 260
+
+
+def build_index(*organizations: Organization) -> PostalCodeIndex:
+    return PostalCodeIndex.build(
+        {org.file: org for org in organizations}, prefixes=PREFIXES
+    )
+
+
+def test_shard_groups_organizations_by_postal_code():
+    index = build_index(
+        organization("adzie", "00-001"),
+        organization("medorowi", "00001"),
+        organization("canisowi", "00-950"),
+        organization("piaseczno", "05-500"),
+    )
+
+    assert index.shard("00")["kody"] == {
+        "00-001": ["adzie", "medorowi"],
+        "00-950": ["canisowi"],
+    }
+    assert index.shard("05")["kody"] == {"05-500": ["piaseczno"]}
+    assert index.shard("30")["kody"] == {}
+
+
+def test_shard_orders_nearest_organizations_by_distance():
+    index = build_index(
+        organization("gdansk", "80-001"),
+        organization("krakow", "30-001"),
+        organization("piaseczno", "05-500"),
+        organization("warszawa", "00-001"),
+    )
+
+    nearest = index.shard("00")["najblizsze"]
+
+    assert [org["adres"] for org in nearest] == [
+        "warszawa",
+        "piaseczno",
+        "krakow",
+        "gdansk",
+    ]
+    assert nearest[0] == {
+        "adres": "warszawa",
+        "nazwa": "Warszawa",
+        "kod": "00-001",
+        "miasto": "Miasto",
+        "odleglosc_km": 0.0,
+    }
+    assert [org["adres"] for org in index.shard("30")["najblizsze"]][0] == "krakow"
+
+
+def test_shard_is_limited():
+    index = build_index(*(organization(f"org{i}", f"00-{i:03d}") for i in range(5)))
+
+    assert len(index.shard("00", limit=3)["najblizsze"]) == 3
+
+
+def test_organizations_outside_the_dataset_are_skipped():
+    index = build_index(
+        organization("warszawa", "00-001"),
+        organization("lodz", "90-001"),
+        organization("bez-kodu", None),
+        organization("zly-kod", "00-00"),
+    )
+
+    shard = index.shard("00")
+    assert [org["adres"] for org in shard["najblizsze"]] == ["warszawa"]
+    with pytest.raises(KeyError):
+        index.shard("90")